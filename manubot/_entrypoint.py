@@ -0,0 +1,17 @@
+"""
+Console script entry point for the manubot command.
+Handles `manubot --version` without importing the command line interface,
+otherwise defers to manubot.command.main.
+"""
+import sys
+
+
+def main():
+    if sys.argv[1:] == ["--version"]:
+        from manubot import __version__
+
+        print(f"v{__version__}")
+        return
+    from manubot.command import main as command_main
+
+    command_main()
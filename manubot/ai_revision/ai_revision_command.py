@@ -14,7 +14,7 @@ def cli_process(args):
         ) from err
 
     # set paths for content
-    content_dir = args.content_directory
+    content_dir = Path(args.content_directory)
     if not content_dir.is_dir():
         raise SystemExit(
             f"content directory is not a directory or does not exist: {content_dir}"
@@ -69,6 +69,8 @@ def call_pandoc(metadata, path, format="plain"):
 
 def _parse_cli_cite_args(args: argparse.Namespace):
     arg_dict = vars(args)
+    if args.output:
+        arg_dict["output"] = pathlib.Path(args.output)
     # infer format from output extension
     if not args.format and args.output:
         arg_dict["format"] = extension_to_format.get(args.output.suffix)
@@ -2,45 +2,141 @@
 Manubot's command line interface
 """
 import argparse
-import logging
-import pathlib
+import functools
 import sys
-import warnings
 
-import manubot
-from manubot.util import import_function
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_CITE_FORMAT_CHOICES = (
+    "csljson",
+    "cslyaml",
+    "plain",
+    "markdown",
+    "docx",
+    "html",
+    "jats",
+)
+# Shortcut flags for manubot cite --format
+_CITE_FORMAT_ALIASES = (
+    ("--yml", "cslyaml"),
+    ("--txt", "plain"),
+    ("--md", "markdown"),
+)
+
+# Diagnostics from setup_logging_and_errors, which only configures logging once
+_DIAGNOSTICS = None
+
+
+@functools.lru_cache(maxsize=None)
+def _version() -> str:
+    """
+    Return the manubot version string displayed by --version.
+    """
+    from manubot import __version__
+
+    return f"v{__version__}"
+
+
+class _VersionAction(argparse.Action):
+    """
+    Print the manubot version and exit. Unlike argparse's built-in "version"
+    action, the version string is only looked up when --version is specified.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(
+            option_strings, dest=dest, default=argparse.SUPPRESS, nargs=0, **kwargs
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(_version())
+        parser.exit()
 
 
 def parse_arguments():
     """
     Read and process command line arguments.
     """
+    subcommand = _sniff_subcommand(sys.argv[1:])
+    parser = _build_parser(subcommand)
+    args = parser.parse_args()
+    return args
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(subcommand=None):
+    """
+    Construct the argument parser. If subcommand is specified, only build the
+    parser for that subcommand. Otherwise, such as for --help or a
+    missing/invalid subcommand, build all subcommand parsers.
+    Parsers are cached, so repeated calls in the same process reuse them.
+    """
     parser = argparse.ArgumentParser(
         description="Manubot: the manuscript bot for scholarly writing"
     )
-    parser.add_argument(
-        "--version", action="version", version=f"v{manubot.__version__}"
-    )
+    parser.add_argument("--version", action=_VersionAction)
     subparsers = parser.add_subparsers(
         title="subcommands", description="All operations are done through subcommands:"
     )
     # Require specifying a sub-command
     subparsers.required = True  # https://bugs.python.org/issue26510
     subparsers.dest = "subcommand"  # https://bugs.python.org/msg186387
-    add_subparser_process(subparsers)
-    add_subparser_cite(subparsers)
-    add_subparser_webpage(subparsers)
-    add_subparser_airevision(subparsers)
-    add_subparser_aicite(subparsers)
+    if subcommand:
+        _SUBPARSER_BUILDERS[subcommand](subparsers)
+    else:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
     for subparser in subparsers.choices.values():
         subparser.add_argument(
             "--log-level",
             default="WARNING",
-            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            choices=_LOG_LEVEL_CHOICES,
             help="Set the logging level for stderr logging",
         )
-    args = parser.parse_args()
-    return args
+    return parser
+
+
+def _sniff_subcommand(argv):
+    """
+    Return the subcommand name from command line arguments (excluding the
+    program name), skipping any top-level options. Return None if the first
+    positional argument is not a known subcommand.
+    """
+    for arg in argv:
+        if arg.startswith("-"):
+            continue
+        return arg if arg in _SUBPARSER_BUILDERS else None
+    return None
+
+
+def _add_content_directory(parser):
+    parser.add_argument(
+        "--content-directory",
+        required=True,
+        help="Directory where manuscript content files are located.",
+    )
+
+
+def _add_model_args(parser, package: str):
+    """
+    Add arguments for selecting and configuring a language model, where
+    package is the module providing the models (e.g. manubot_ai_editor).
+    """
+    parser.add_argument(
+        "--model-type",
+        type=str,
+        required=False,
+        default="GPT3CompletionModel",
+        help="Model type used to revise the manuscript. Default is GPT3CompletionModel. "
+        f"It can be any subclass of {package}.models.ManuscriptRevisionModel",
+    )
+    parser.add_argument(
+        "--model-kwargs",
+        required=False,
+        metavar="key=value",
+        nargs="+",
+        help="Keyword arguments for the revision model (--model-type), with format key=value.",
+    )
 
 
 def add_subparser_process(subparsers):
@@ -50,15 +146,9 @@ def add_subparser_process(subparsers):
         description="Process manuscript content to create outputs for Pandoc consumption. "
         "Performs bibliographic processing and templating.",
     )
-    parser.add_argument(
-        "--content-directory",
-        type=pathlib.Path,
-        required=True,
-        help="Directory where manuscript content files are located.",
-    )
+    _add_content_directory(parser)
     parser.add_argument(
         "--output-directory",
-        type=pathlib.Path,
         required=True,
         help="Directory to output files generated by this script.",
     )
@@ -87,7 +177,6 @@ def add_subparser_process(subparsers):
     )
     parser.add_argument(
         "--cache-directory",
-        type=pathlib.Path,
         help="Custom cache directory. If not specified, caches to output-directory.",
     )
     parser.add_argument("--clear-requests-cache", action="store_true")
@@ -109,40 +198,26 @@ def add_subparser_cite(subparsers):
     )
     parser.add_argument(
         "--output",
-        type=pathlib.Path,
         help="Specify a file to write output, otherwise default to stdout.",
     )
     format_group = parser.add_mutually_exclusive_group()
     format_group.add_argument(
         "--format",
-        choices=["csljson", "cslyaml", "plain", "markdown", "docx", "html", "jats"],
+        choices=_CITE_FORMAT_CHOICES,
         help="Format to use for output file. "
         "csljson and cslyaml output the CSL data. "
         "All other choices render the references using Pandoc. "
         "If not specified, attempt to infer this from the --output filename extension. "
         "Otherwise, default to csljson.",
     )
-    format_group.add_argument(
-        "--yml",
-        dest="format",
-        action="store_const",
-        const="cslyaml",
-        help="Short for --format=cslyaml.",
-    )
-    format_group.add_argument(
-        "--txt",
-        dest="format",
-        action="store_const",
-        const="plain",
-        help="Short for --format=plain.",
-    )
-    format_group.add_argument(
-        "--md",
-        dest="format",
-        action="store_const",
-        const="markdown",
-        help="Short for --format=markdown.",
-    )
+    for flag, format_ in _CITE_FORMAT_ALIASES:
+        format_group.add_argument(
+            flag,
+            dest="format",
+            action="store_const",
+            const=format_,
+            help=f"Short for --format={format_}.",
+        )
     parser.add_argument(
         "--csl",
         # redirects to the latest Manubot CSL Style.
@@ -215,8 +290,7 @@ def add_subparser_webpage(subparsers):
     )
     cache_group.add_argument(
         "--ots-cache",
-        default=pathlib.Path("ci/cache/ots"),
-        type=pathlib.Path,
+        default="ci/cache/ots",
         help="location for the timestamp cache (default: ci/cache/ots).",
     )
     parser.set_defaults(function="manubot.webpage.webpage_command.cli_webpage")
@@ -228,65 +302,46 @@ def add_subparser_airevision(subparsers):
         help="revise manuscript content with language models",
         description="Revise manuscript content using AI models to suggest text improvements.",
     )
-    parser.add_argument(
-        "--content-directory",
-        type=pathlib.Path,
-        required=True,
-        help="Directory where manuscript content files are located.",
-    )
-    parser.add_argument(
-        "--model-type",
-        type=str,
-        required=False,
-        default="GPT3CompletionModel",
-        help="Model type used to revise the manuscript. Default is GPT3CompletionModel. "
-        "It can be any subclass of manubot_ai_editor.models.ManuscriptRevisionModel",
-    )
-    parser.add_argument(
-        "--model-kwargs",
-        required=False,
-        metavar="key=value",
-        nargs="+",
-        help="Keyword arguments for the revision model (--model-type), with format key=value.",
-    )
+    _add_content_directory(parser)
+    _add_model_args(parser, package="manubot_ai_editor")
     parser.set_defaults(function="manubot.ai_revision.ai_revision_command.cli_process")
 
+
 def add_subparser_aicite(subparsers):
     parser = subparsers.add_parser(
         name="ai-cite",
         help="revise manuscript content with suggested citations",
         description="Revise manuscript content using AI models to suggest citations.",
     )
-    parser.add_argument(
-        "--content-directory",
-        type=pathlib.Path,
-        required=True,
-        help="Directory where manuscript content files are located.",
-    )
-    parser.add_argument(
-        "--model-type",
-        type=str,
-        required=False,
-        default="GPT3CompletionModel",
-        help="Model type used to revise the manuscript. Default is GPT3CompletionModel. "
-        "It can be any subclass of manubot_ai_cite.models.ManuscriptRevisionModel",
-    )
-    parser.add_argument(
-        "--model-kwargs",
-        required=False,
-        metavar="key=value",
-        nargs="+",
-        help="Keyword arguments for the revision model (--model-type), with format key=value.",
-    )
+    _add_content_directory(parser)
+    _add_model_args(parser, package="manubot_ai_cite")
     parser.set_defaults(function="manubot.ai_cite.ai_cite_command.cli_process")
 
 
+_SUBPARSER_BUILDERS = {
+    "process": add_subparser_process,
+    "cite": add_subparser_cite,
+    "webpage": add_subparser_webpage,
+    "ai-revision": add_subparser_airevision,
+    "ai-cite": add_subparser_aicite,
+}
+
+
 def setup_logging_and_errors() -> dict:
     """
     Configure warnings and logging.
     Set up an ErrorHandler to detect whether messages have been logged
     at or above the ERROR level.
+    Configuration only occurs on the first call,
+    subsequent calls return the same diagnostics.
     """
+    global _DIAGNOSTICS
+    if _DIAGNOSTICS is not None:
+        return _DIAGNOSTICS
+
+    import logging
+    import warnings
+
     import errorhandler
 
     # Track if message gets logged with severity of error or greater
@@ -304,10 +359,11 @@ def setup_logging_and_errors() -> dict:
         logging.Formatter("## {levelname}\n{message}", style="{")
     )
     logger.addHandler(stream_handler)
-    return {
+    _DIAGNOSTICS = {
         "logger": logger,
         "error_handler": error_handler,
     }
+    return _DIAGNOSTICS
 
 
 def exit_if_error_handler_fired(error_handler):
@@ -316,18 +372,36 @@ def exit_if_error_handler_fired(error_handler):
     exit Python with a nonzero code.
     """
     if error_handler.fired:
+        import logging
+
         logging.critical("Failure: exiting with code 1 due to logged errors")
         raise SystemExit(1)
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_function(name: str):
+    """
+    Import the subcommand function specified by its dotted path. Results are
+    cached, so repeated calls to main in the same process skip the import.
+    """
+    from manubot.util import import_function
+
+    return import_function(name)
+
+
 def main():
     """
-    Called as a console_scripts entry point in setup.cfg. This function defines
+    Called by the console_scripts entry point in setup.cfg (via
+    manubot._entrypoint, which handles --version). This function defines
     the manubot command line script.
     """
-    diagnostics = setup_logging_and_errors()
+    # Parse arguments first, so --help and usage errors exit before logging setup
     args = parse_arguments()
-    diagnostics["logger"].setLevel(getattr(logging, args.log_level))
-    function = import_function(args.function)
+    diagnostics = setup_logging_and_errors()
+    # Only consider errors logged by this invocation
+    diagnostics["error_handler"].reset()
+    # Logger.setLevel accepts level names such as "WARNING"
+    diagnostics["logger"].setLevel(args.log_level)
+    function = _resolve_function(args.function)
     function(args)
     exit_if_error_handler_fired(diagnostics["error_handler"])
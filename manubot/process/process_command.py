@@ -1,11 +1,13 @@
 import logging
+import pathlib
 
 
 def cli_process(args):
     args_dict = vars(args)
 
     # Set paths for content
-    content_dir = args.content_directory
+    content_dir = pathlib.Path(args.content_directory)
+    args_dict["content_directory"] = content_dir
     if not content_dir.is_dir():
         logging.warning(f"content directory does not exist: {content_dir}")
     args_dict["citation_tags_path"] = content_dir.joinpath("citation-tags.tsv")
@@ -15,7 +17,8 @@ def cli_process(args):
     )
 
     # Set paths for output
-    output_dir = args.output_directory
+    output_dir = pathlib.Path(args.output_directory)
+    args_dict["output_directory"] = output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
     args_dict["manuscript_path"] = output_dir.joinpath("manuscript.md")
     args_dict["citations_path"] = output_dir.joinpath("citations.tsv")
@@ -23,7 +26,7 @@ def cli_process(args):
     args_dict["variables_path"] = output_dir.joinpath("variables.json")
 
     # Set paths for caching
-    args_dict["cache_directory"] = args.cache_directory or output_dir
+    args_dict["cache_directory"] = pathlib.Path(args.cache_directory or output_dir)
     args.cache_directory.mkdir(parents=True, exist_ok=True)
     args_dict["requests_cache_path"] = str(
         args.cache_directory.joinpath("requests-cache")
@@ -28,6 +28,10 @@ from manubot.util import (
     read_serialized_dict,
 )
 
+# Match `namespace=path_or_url`, where namespace is a valid jinja2 variable name
+# http://jinja.pocoo.org/docs/2.10/api/#identifier-naming
+template_variables_namespace_pattern = re.compile(r"([a-zA-Z_][a-zA-Z0-9_]*)=(.+)")
+
 
 def read_variable_files(paths: List[str], variables: Optional[dict] = None) -> dict:
     """
@@ -55,9 +59,7 @@ def read_variable_files(paths: List[str], variables: Optional[dict] = None) -> d
         variables = {}
     for path in paths:
         logging.info(f"Reading user-provided templating variables at {path!r}")
-        # Match only namespaces that are valid jinja2 variable names
-        # http://jinja.pocoo.org/docs/2.10/api/#identifier-naming
-        match = re.match(r"([a-zA-Z_][a-zA-Z0-9_]*)=(.+)", path)
+        match = template_variables_namespace_pattern.match(path)
         if match:
             namespace, path = match.groups()
             logging.info(
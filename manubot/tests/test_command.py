@@ -1,6 +1,9 @@
 import subprocess
 
+import pytest
+
 import manubot
+from manubot.command import _sniff_subcommand
 
 
 def test_version():
@@ -18,3 +21,17 @@ def test_missing_subcommand():
     print(process.stderr)
     assert process.returncode == 2
     assert "error: the following arguments are required: subcommand" in process.stderr
+
+
+@pytest.mark.parametrize(
+    "argv,subcommand",
+    [
+        ([], None),
+        (["--help"], None),
+        (["cite", "--md", "doi:10.7554/elife.32822"], "cite"),
+        (["--version", "ai-revision"], "ai-revision"),
+        (["not-a-subcommand", "cite"], None),
+    ],
+)
+def test_sniff_subcommand(argv, subcommand):
+    assert _sniff_subcommand(argv) == subcommand